@@ -0,0 +1,74 @@
+# cython: language_level=3
+# """
+# Compiled core of welch_t_test in dynamicStatisticalAnalyzer.py
+# Build with cythonize; the analyzer falls back to NumPy when this module is absent
+# """
+
+cimport cython
+from libc.math cimport sqrt, fabs
+from scipy.special.cython_special cimport stdtr, stdtrit
+
+
+cdef struct WelchResult:
+    double mean_a
+    double mean_b
+    double t
+    double df
+    double p
+    double ci_low
+    double ci_high
+    double d
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cdef void _moments(const double* x, Py_ssize_t n, double* mean, double* var) noexcept nogil:
+    """Mean and sample variance in one pass (sums shifted by x[0] to limit cancellation)"""
+    cdef Py_ssize_t i
+    cdef double shift = x[0]
+    cdef double total = 0.0
+    cdef double total_sq = 0.0
+    cdef double d
+    for i in range(n):
+        d = x[i] - shift
+        total += d
+        total_sq += d * d
+    mean[0] = shift + total / n
+    var[0] = (total_sq - total * total / n) / (n - 1)
+
+
+@cython.cdivision(True)
+cdef WelchResult _welch_core(const double* a, Py_ssize_t na, const double* b, Py_ssize_t nb,
+                             double cl) noexcept nogil:
+    """Welch's t-test on two contiguous double buffers of at least 2 values each"""
+    cdef WelchResult r
+    cdef double var_a, var_b, se2_a, se2_b, pooled_se, diff, margin
+    
+    _moments(a, na, &r.mean_a, &var_a)
+    _moments(b, nb, &r.mean_b, &var_b)
+    
+    se2_a = var_a / na
+    se2_b = var_b / nb
+    pooled_se = sqrt(se2_a + se2_b)
+    diff = r.mean_a - r.mean_b
+    
+    r.t = diff / pooled_se
+    r.df = (se2_a + se2_b) * (se2_a + se2_b) / (se2_a * se2_a / (na - 1) + se2_b * se2_b / (nb - 1))
+    r.p = 2.0 * stdtr(r.df, -fabs(r.t))
+    r.d = diff / sqrt(((na - 1) * var_a + (nb - 1) * var_b) / (na + nb - 2))
+    
+    margin = -stdtrit(r.df, (1.0 - cl) / 2.0) * pooled_se
+    r.ci_low = diff - margin
+    r.ci_high = diff + margin
+    return r
+
+
+def welch_core(const double[::1] a, const double[::1] b, double confidence_level):
+    """Welch's t-test core, returns (mean_a, mean_b, t, df, p, ci_lower, ci_upper, cohens_d)"""
+    cdef WelchResult r
+    if a.shape[0] < 2 or b.shape[0] < 2:
+        raise ValueError('welch_core needs at least 2 observations per group')
+    with nogil:
+        r = _welch_core(&a[0], a.shape[0], &b[0], b.shape[0], confidence_level)
+    return r.mean_a, r.mean_b, r.t, r.df, r.p, r.ci_low, r.ci_high, r.d
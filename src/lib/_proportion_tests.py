@@ -0,0 +1,37 @@
+# """
+# Two-proportion z-test core shared by statistics.py and dynamicStatisticalAnalyzer.py
+# """
+
+import math
+import scipy.stats as stats
+from scipy import special
+from functools import lru_cache
+
+
+@lru_cache(maxsize=64)
+def z_cl(confidence_level: float) -> float:
+    """Two-sided critical z value for a confidence level (cached)"""
+    return float(stats.norm.isf((1 - confidence_level) / 2))
+
+
+def _sqrt_or_nan(value: float) -> float:
+    """Scalar square root that yields NaN for negative input, as np.sqrt does"""
+    return math.sqrt(value) if value >= 0 else math.nan
+
+
+@lru_cache(maxsize=100_000)
+def prop_ztest_core(x1: int, n1: int, x2: int, n2: int, confidence_level: float):
+    """Two-proportion z-test for p2 - p1, returns (z, two-tailed p, ci_lower, ci_upper) (cached)"""
+    p1 = x1 / n1
+    p2 = x2 / n2
+    p_pool = (x1 + x2) / (n1 + n2)
+    diff = p2 - p1
+    
+    # Pooled SE for the statistic, unpooled SE for the interval
+    # (negative variance terms arise when a group holds values outside [0, 1])
+    standard_error = _sqrt_or_nan(p_pool * (1 - p_pool) * (1 / n1 + 1 / n2))
+    z_score = diff / standard_error if standard_error > 0 else math.nan
+    p_value = 2 * float(special.ndtr(-abs(z_score)))
+    margin_of_error = z_cl(confidence_level) * _sqrt_or_nan(p1 * (1 - p1) / n1 + p2 * (1 - p2) / n2)
+    
+    return z_score, p_value, diff - margin_of_error, diff + margin_of_error
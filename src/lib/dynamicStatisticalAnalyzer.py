@@ -5,24 +5,59 @@
 
 import numpy as np
 import scipy.stats as stats
+from scipy import special
 from typing import List, Dict, Any, Optional, Union, Literal
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+
+from _proportion_tests import prop_ztest_core
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; NumPy reductions are used instead
+    njit = None
+    prange = range
+
+try:
+    import cupy as cp
+except ImportError:  # cupy is optional; analyze_many_gpu falls back to the CPU batch
+    cp = None
+
+try:
+    from _fast_tests import welch_core
+except ImportError:  # compiled extension is optional; see _fast_tests.pyx
+    welch_core = None
 
 
 DataType = Literal['continuous', 'binary', 'categorical']
 TestType = Literal['t-test', 'z-test', 'chi-squared']
 
+BATCH_RESULT_DTYPE = np.dtype([
+    ('test_statistic', np.float64),
+    ('degrees_of_freedom', np.float64),
+    ('p_value', np.float64),
+    ('ci_lower', np.float64),
+    ('ci_upper', np.float64),
+    ('effect_size', np.float64),
+    ('is_significant', np.bool_),
+])
+
 
 @dataclass
 class StatisticalInputs:
-    group_a: List[float]
-    group_b: List[float]
+    group_a: Union[List[float], np.ndarray]
+    group_b: Union[List[float], np.ndarray]
     significance_level: float
     power: float
     confidence_level: float
 
 
 @dataclass
+class BinarySummary:
+    n: int  # Observations
+    x: int  # Successes (conversions)
+
+
+@dataclass(slots=True)
 class StatisticalResult:
     data_type: DataType
     test_type: TestType
@@ -35,6 +70,110 @@ class StatisticalResult:
     test_details: Dict[str, Any]
 
 
+# Upper-tail lookup tables for fast_t_sf / fast_norm_sf, meant for vectorized
+# batch evaluation (scalar tests use the exact special functions instead).
+# Each table stores the log-survival minus its analytic tail term (see
+# _t_log_tail; -z^2/2 for the normal), which is smooth enough for linear
+# interpolation on a uniform |t| grid and a log-spaced df grid. Off-grid
+# inputs and underflowed cells fall back to scipy.
+_T_GRID_T = np.linspace(0, 50, 2048)
+_T_GRID_DF = np.geomspace(1, 1e6, 256)
+_T_GRID_LOG_DF = np.log(_T_GRID_DF)
+_Z_GRID = np.linspace(0, 37, 2048)
+
+
+def _t_log_tail(t, df):
+    """Leading term of the Student-t log-survival function"""
+    return -0.5 * (df + 1) * np.log1p(t * t / df)
+
+
+with np.errstate(divide='ignore'):
+    _T_LOGSF_RESIDUAL = (stats.t.logsf(_T_GRID_T[None, :], _T_GRID_DF[:, None]) -
+                         _t_log_tail(_T_GRID_T[None, :], _T_GRID_DF[:, None]))
+    _Z_LOGSF_RESIDUAL = stats.norm.logsf(_Z_GRID) + _Z_GRID**2 / 2
+
+
+def _grid_position(x: np.ndarray, grid: np.ndarray):
+    """Cell index and fractional offset of x on a uniform grid"""
+    position = (x - grid[0]) / (grid[1] - grid[0])
+    index = np.minimum(position.astype(np.int64), grid.size - 2)
+    return index, position - index
+
+
+def fast_t_sf(t, df):
+    """Student-t survival function via bilinear table lookup"""
+    t, df = np.broadcast_arrays(np.asarray(t, dtype=np.float64), np.asarray(df, dtype=np.float64))
+    abs_t = np.abs(t)
+    result = np.full(t.shape, np.nan)
+    inside = (abs_t < _T_GRID_T[-1]) & (df >= _T_GRID_DF[0]) & (df < _T_GRID_DF[-1])
+    
+    if inside.any():
+        t_in = abs_t[inside]
+        df_in = df[inside]
+        ti, t_frac = _grid_position(t_in, _T_GRID_T)
+        di, df_frac = _grid_position(np.log(df_in), _T_GRID_LOG_DF)
+        table = _T_LOGSF_RESIDUAL
+        with np.errstate(invalid='ignore'):
+            low = table[di, ti] + t_frac * (table[di, ti + 1] - table[di, ti])
+            high = table[di + 1, ti] + t_frac * (table[di + 1, ti + 1] - table[di + 1, ti])
+            tail = np.exp(low + df_frac * (high - low) + _t_log_tail(t_in, df_in))
+        result[inside] = np.where(t[inside] < 0, 1 - tail, tail)
+    
+    # Off-grid inputs and underflowed table cells use the exact distribution
+    fallback = ~np.isfinite(result)
+    if fallback.any():
+        result[fallback] = stats.t.sf(t[fallback], df[fallback])
+    return result[()]
+
+
+def fast_norm_sf(z):
+    """Standard normal survival function via table lookup"""
+    z = np.asarray(z, dtype=np.float64)
+    abs_z = np.abs(z)
+    result = np.full(z.shape, np.nan)
+    inside = abs_z < _Z_GRID[-1]
+    
+    if inside.any():
+        z_in = abs_z[inside]
+        zi, z_frac = _grid_position(z_in, _Z_GRID)
+        table = _Z_LOGSF_RESIDUAL
+        tail = np.exp(table[zi] + z_frac * (table[zi + 1] - table[zi]) - z_in**2 / 2)
+        result[inside] = np.where(z[inside] < 0, 1 - tail, tail)
+    
+    fallback = ~np.isfinite(result)
+    if fallback.any():
+        result[fallback] = stats.norm.sf(z[fallback])
+    return result[()]
+
+
+def _two_pass_mean_var(data: np.ndarray):
+    """Mean and sample variance for the batch kernel, returns (mean, var, n)"""
+    # Two plain reductions vectorize under numba; a Welford update divides
+    # on every element and serializes the loop
+    n = data.size
+    if n == 0:
+        return np.nan, np.nan, n
+    total = 0.0
+    for value in data:
+        total += value
+    mean_val = total / n
+    if n < 2:
+        return mean_val, np.nan, n
+    squares = 0.0
+    for value in data:
+        delta = value - mean_val
+        squares += delta * delta
+    return mean_val, squares / (n - 1), n
+
+
+if njit is not None:
+    _mean_var = njit(cache=True, fastmath=True)(_two_pass_mean_var)
+else:
+    def _mean_var(data: np.ndarray):
+        """Mean and sample variance via NumPy, returns (mean, var, n)"""
+        return data.mean(), data.var(ddof=1), data.size
+
+
 def mean(data: List[float]) -> float:
     """Calculate mean of data"""
     return np.mean(data)
@@ -50,52 +189,81 @@ def standard_deviation(data: List[float]) -> float:
     return np.std(data, ddof=1)
 
 
-def detect_data_type(data: List[float]) -> DataType:
+_DETECT_PROBE = 256
+
+
+def detect_data_type(data: np.ndarray) -> DataType:
     """Detect data type from numerical data"""
-    unique_values = list(set(data))
-    
-    # Check if binary (only 0s and 1s)
-    if all(val == 0 or val == 1 for val in unique_values):
+    # A non-integer among the leading values settles continuous data
+    # without sorting the whole array
+    head = data[:_DETECT_PROBE]
+    if not np.array_equal(np.trunc(head), head):
+        return 'continuous'
+    
+    # Check if binary (only 0s and 1s) in one linear pass, no sort
+    if ((data == 0) | (data == 1)).all():
         return 'binary'
     
     # Check if categorical (limited discrete values)
-    if len(unique_values) <= 10 and all(float(val).is_integer() for val in unique_values):
+    unique_values = np.unique(data)
+    if unique_values.size <= 10 and np.all(np.mod(unique_values, 1) == 0):
         return 'categorical'
     
     return 'continuous'
 
 
-def welch_t_test(group_a: List[float], group_b: List[float], 
-                alpha: float, confidence_level: float) -> StatisticalResult:
-    """Perform Welch's t-test for continuous data"""
-    mean_a = np.mean(group_a)
-    mean_b = np.mean(group_b)
-    var_a = np.var(group_a, ddof=1)
-    var_b = np.var(group_b, ddof=1)
-    n_a = len(group_a)
-    n_b = len(group_b)
+def _welch_core_py(group_a: np.ndarray, group_b: np.ndarray, confidence_level: float):
+    """Welch's t-test core, returns (mean_a, mean_b, t, df, p, ci_lower, ci_upper, cohens_d)"""
+    mean_a = group_a.mean()
+    mean_b = group_b.mean()
+    var_a = group_a.var(ddof=1)
+    var_b = group_b.var(ddof=1)
+    n_a = group_a.size
+    n_b = group_b.size
+    
+    # Per-group squared standard errors, shared by the t-statistic, df and CI
+    se2_a = var_a / n_a
+    se2_b = var_b / n_b
     
     # Welch's t-statistic
-    pooled_se = np.sqrt(var_a / n_a + var_b / n_b)
-    t = (mean_a - mean_b) / pooled_se
+    pooled_se = np.sqrt(se2_a + se2_b)
+    diff = mean_a - mean_b
+    t = diff / pooled_se
     
     # Welch-Satterthwaite degrees of freedom
-    df = (var_a / n_a + var_b / n_b)**2 / ((var_a / n_a)**2 / (n_a - 1) + (var_b / n_b)**2 / (n_b - 1))
+    df = (se2_a + se2_b)**2 / (se2_a**2 / (n_a - 1) + se2_b**2 / (n_b - 1))
     
     # P-value (two-tailed)
-    p_value = 2 * (1 - stats.t.cdf(abs(t), df))
+    p_value = 2 * special.stdtr(df, -abs(t))
     
     # Effect size (Cohen's d)
     pooled_sd = np.sqrt(((n_a - 1) * var_a + (n_b - 1) * var_b) / (n_a + n_b - 2))
-    cohens_d = (mean_a - mean_b) / pooled_sd
+    cohens_d = diff / pooled_sd
     
     # Confidence interval for difference
-    t_critical = stats.t.ppf(1 - (1 - confidence_level) / 2, df)
+    t_critical = stats.t.isf((1 - confidence_level) / 2, df)
     margin_of_error = t_critical * pooled_se
-    diff = mean_a - mean_b
+    
+    return (mean_a, mean_b, t, df, p_value,
+            diff - margin_of_error, diff + margin_of_error, cohens_d)
+
+
+def welch_t_test(group_a: np.ndarray, group_b: np.ndarray, 
+                alpha: float, confidence_level: float) -> StatisticalResult:
+    """Perform Welch's t-test for continuous data"""
+    # The compiled core needs at least two observations per group for a variance
+    if welch_core is not None and group_a.size > 1 and group_b.size > 1:
+        # The compiled core only takes C-contiguous float64 buffers
+        core = welch_core(np.ascontiguousarray(group_a, dtype=np.float64),
+                          np.ascontiguousarray(group_b, dtype=np.float64), confidence_level)
+    else:
+        core = _welch_core_py(group_a, group_b, confidence_level)
+    mean_a, mean_b, t, df, p_value, ci_lower, ci_upper, cohens_d = core
     
     is_significant = p_value < alpha
-    winner = 'Group A' if mean_a > mean_b else 'Group B' if is_significant else None
+    a_higher = mean_a > mean_b
+    winner = 'Group A' if a_higher else ('Group B' if is_significant else None)
+    direction = 'higher than' if a_higher else 'lower than'
     
     return StatisticalResult(
         data_type='continuous',
@@ -103,8 +271,8 @@ def welch_t_test(group_a: List[float], group_b: List[float],
         test_statistic=t,
         p_value=p_value,
         confidence_interval={
-            'lower': diff - margin_of_error,
-            'upper': diff + margin_of_error
+            'lower': ci_lower,
+            'upper': ci_upper
         },
         effect_size=cohens_d,
         is_significant=is_significant,
@@ -112,7 +280,7 @@ def welch_t_test(group_a: List[float], group_b: List[float],
             'decision': 'reject' if is_significant else 'fail_to_reject',
             'plain_language': (
                 f"There is a statistically significant difference between the groups (p = {p_value:.4f}). "
-                f"Group A mean ({mean_a:.2f}) {'is significantly higher than' if mean_a > mean_b else 'is significantly lower than'} "
+                f"Group A mean ({mean_a:.2f}) is significantly {direction} "
                 f"Group B mean ({mean_b:.2f}). Winner: {winner}."
             ) if is_significant else (
                 f"There is no statistically significant difference between the groups (p = {p_value:.4f}). "
@@ -133,30 +301,29 @@ def welch_t_test(group_a: List[float], group_b: List[float],
     )
 
 
-def two_proportion_z_test(group_a: List[float], group_b: List[float], 
+def summarize_binary(data: np.ndarray) -> BinarySummary:
+    """Reduce 0/1 observations to their count and number of successes"""
+    return BinarySummary(n=data.size, x=int(data.sum()))
+
+
+def two_proportion_z_test(group_a: np.ndarray, group_b: np.ndarray, 
                          alpha: float, confidence_level: float) -> StatisticalResult:
     """Perform two-proportion z-test for binary data"""
-    n_a = len(group_a)
-    n_b = len(group_b)
-    x_a = sum(group_a)
-    x_b = sum(group_b)
-    
-    p_a = x_a / n_a
-    p_b = x_b / n_b
-    p_pool = (x_a + x_b) / (n_a + n_b)
-    
-    # Z-statistic
-    standard_error = np.sqrt(p_pool * (1 - p_pool) * (1/n_a + 1/n_b))
-    z = (p_a - p_b) / standard_error
-    
-    # P-value (two-tailed)
-    p_value = 2 * (1 - stats.norm.cdf(abs(z)))
-    
-    # Confidence interval for difference
-    z_critical = stats.norm.ppf(1 - (1 - confidence_level) / 2)
-    se_diff = np.sqrt((p_a * (1 - p_a) / n_a) + (p_b * (1 - p_b) / n_b))
+    summary_a = summarize_binary(group_a)
+    summary_b = summarize_binary(group_b)
+    return two_proportion_z_test_summary(summary_a, summary_b, alpha, confidence_level)
+
+
+def two_proportion_z_test_summary(summary_a: BinarySummary, summary_b: BinarySummary,
+                                  alpha: float, confidence_level: float) -> StatisticalResult:
+    """Perform two-proportion z-test from conversion counts, without per-observation data"""
+    # The shared core reports p2 - p1, so pass B first to get A - B
+    z, p_value, ci_lower, ci_upper = prop_ztest_core(
+        summary_b.x, summary_b.n, summary_a.x, summary_a.n, round(confidence_level, 6)
+    )
+    p_a = summary_a.x / summary_a.n
+    p_b = summary_b.x / summary_b.n
     diff = p_a - p_b
-    margin_of_error = z_critical * se_diff
     
     is_significant = p_value < alpha
     
@@ -166,8 +333,8 @@ def two_proportion_z_test(group_a: List[float], group_b: List[float],
         test_statistic=z,
         p_value=p_value,
         confidence_interval={
-            'lower': diff - margin_of_error,
-            'upper': diff + margin_of_error
+            'lower': ci_lower,
+            'upper': ci_upper
         },
         effect_size=diff,  # Difference in proportions
         is_significant=is_significant,
@@ -195,26 +362,24 @@ def two_proportion_z_test(group_a: List[float], group_b: List[float],
     )
 
 
-def chi_squared_test(group_a: List[float], group_b: List[float], 
+def chi_squared_test(group_a: np.ndarray, group_b: np.ndarray, 
                     alpha: float, confidence_level: float) -> StatisticalResult:
     """Perform chi-squared test for categorical data"""
-    # Create contingency table
-    unique_values = sorted(list(set(group_a + group_b)))
-    contingency_table = []
+    # Create contingency table: sorted shared categories without
+    # materializing the concatenated groups
+    categories = np.union1d(np.unique(group_a), np.unique(group_b))
+    k = categories.size
     
     # Count frequencies
-    for value in unique_values:
-        count_a = group_a.count(value)
-        count_b = group_b.count(value)
-        contingency_table.append([count_a, count_b])
-    
-    contingency_array = np.array(contingency_table)
+    counts_a = np.bincount(np.searchsorted(categories, group_a), minlength=k)
+    counts_b = np.bincount(np.searchsorted(categories, group_b), minlength=k)
+    contingency_array = np.column_stack([counts_a, counts_b])
     
     # Calculate chi-squared statistic
     chi2, p_value, dof, expected = stats.chi2_contingency(contingency_array)
     
     # Effect size (Cramér's V)
-    total_n = len(group_a) + len(group_b)
+    total_n = group_a.size + group_b.size
     effect_size = np.sqrt(chi2 / total_n)
     
     is_significant = p_value < alpha
@@ -256,7 +421,9 @@ def chi_squared_test(group_a: List[float], group_b: List[float],
 
 def analyze_data(inputs: StatisticalInputs) -> StatisticalResult:
     """Main analysis function that detects data type and applies appropriate test"""
-    group_a, group_b = inputs.group_a, inputs.group_b
+    # Convert once and reuse the arrays for detection and the test itself
+    group_a = np.ascontiguousarray(inputs.group_a, dtype=np.float64)
+    group_b = np.ascontiguousarray(inputs.group_b, dtype=np.float64)
     significance_level = inputs.significance_level
     confidence_level = inputs.confidence_level
     
@@ -281,10 +448,187 @@ def analyze_data(inputs: StatisticalInputs) -> StatisticalResult:
         return welch_t_test(group_a, group_b, significance_level, confidence_level)
 
 
+def _welch_batch_kernel(values_a: np.ndarray, offsets_a: np.ndarray,
+                        values_b: np.ndarray, offsets_b: np.ndarray,
+                        diff: np.ndarray, se: np.ndarray, df: np.ndarray, effect: np.ndarray) -> None:
+    """Per-test Welch statistics over CSR-packed groups, written into the output arrays"""
+    for i in prange(diff.size):
+        mean_a, var_a, n_a = _mean_var(values_a[offsets_a[i]:offsets_a[i + 1]])
+        mean_b, var_b, n_b = _mean_var(values_b[offsets_b[i]:offsets_b[i + 1]])
+        se2_a = var_a / n_a
+        se2_b = var_b / n_b
+        diff[i] = mean_a - mean_b
+        se[i] = np.sqrt(se2_a + se2_b)
+        df[i] = (se2_a + se2_b)**2 / (se2_a**2 / (n_a - 1) + se2_b**2 / (n_b - 1))
+        effect[i] = diff[i] / np.sqrt(((n_a - 1) * var_a + (n_b - 1) * var_b) / (n_a + n_b - 2))
+
+
+if njit is not None:
+    _welch_batch_kernel = njit(parallel=True, cache=True, error_model='numpy')(_welch_batch_kernel)
+
+
+def _pack_groups(groups: List[np.ndarray]):
+    """Flatten variable-size groups into one float64 array plus CSR-style offsets"""
+    offsets = np.zeros(len(groups) + 1, dtype=np.int64)
+    np.cumsum([len(group) for group in groups], out=offsets[1:])
+    if not groups:
+        return np.empty(0, dtype=np.float64), offsets
+    values = np.concatenate([np.asarray(group, dtype=np.float64) for group in groups])
+    return values, offsets
+
+
+def _welch_batch_result(diff: np.ndarray, se: np.ndarray, df: np.ndarray, effect: np.ndarray,
+                        alpha: float, confidence_level: float) -> np.ndarray:
+    """Assemble p-values and confidence intervals for a batch of Welch statistics"""
+    t = diff / se
+    p_value = 2 * fast_t_sf(np.abs(t), df)
+    margin_of_error = stats.t.isf((1 - confidence_level) / 2, df) * se
+    
+    results = np.empty(diff.size, dtype=BATCH_RESULT_DTYPE)
+    results['test_statistic'] = t
+    results['degrees_of_freedom'] = df
+    results['p_value'] = p_value
+    results['ci_lower'] = diff - margin_of_error
+    results['ci_upper'] = diff + margin_of_error
+    results['effect_size'] = effect
+    results['is_significant'] = p_value < alpha
+    return results
+
+
+def _welch_batch_cpu(values_a: np.ndarray, offsets_a: np.ndarray,
+                     values_b: np.ndarray, offsets_b: np.ndarray):
+    """Run the CPU batch kernel, returns (diff, se, df, effect) arrays"""
+    n_tests = offsets_a.size - 1
+    diff = np.empty(n_tests)
+    se = np.empty(n_tests)
+    df = np.empty(n_tests)
+    effect = np.empty(n_tests)
+    _welch_batch_kernel(values_a, offsets_a, values_b, offsets_b, diff, se, df, effect)
+    return diff, se, df, effect
+
+
+def analyze_many(groups_a: List[np.ndarray], groups_b: List[np.ndarray],
+                 alpha: float, confidence_level: float) -> np.ndarray:
+    """Run independent Welch's t-tests on each (groups_a[i], groups_b[i]) pair in parallel"""
+    if len(groups_a) != len(groups_b):
+        raise ValueError('groups_a and groups_b must contain the same number of groups')
+    
+    values_a, offsets_a = _pack_groups(groups_a)
+    values_b, offsets_b = _pack_groups(groups_b)
+    
+    diff, se, df, effect = _welch_batch_cpu(values_a, offsets_a, values_b, offsets_b)
+    return _welch_batch_result(diff, se, df, effect, alpha, confidence_level)
+
+
+# Threads per block for segment_moments. Also sizes the kernel's shared
+# arrays; must be a power of two for the halving reduction.
+_SEGMENT_MOMENTS_BLOCK = 256
+if _SEGMENT_MOMENTS_BLOCK & (_SEGMENT_MOMENTS_BLOCK - 1):
+    raise ValueError('_SEGMENT_MOMENTS_BLOCK must be a power of two')
+
+_SEGMENT_MOMENTS_SOURCE = f'#define SEGMENT_MOMENTS_BLOCK {_SEGMENT_MOMENTS_BLOCK}\n' + r'''
+extern "C" __global__
+void segment_moments(const double* values, const long long* offsets,
+                     double* mean, double* var, long long* count)
+{
+    __shared__ double s_sum[SEGMENT_MOMENTS_BLOCK];
+    __shared__ double s_sq[SEGMENT_MOMENTS_BLOCK];
+    const unsigned int tid = threadIdx.x;
+    const long long start = offsets[blockIdx.x];
+    const long long stop = offsets[blockIdx.x + 1];
+    const long long n = stop - start;
+    const double shift = n > 0 ? values[start] : 0.0;
+
+    // Shifted sum / sum of squares, one block per segment
+    double sum = 0.0;
+    double sq = 0.0;
+    for (long long i = start + tid; i < stop; i += blockDim.x) {
+        const double d = values[i] - shift;
+        sum += d;
+        sq += d * d;
+    }
+    s_sum[tid] = sum;
+    s_sq[tid] = sq;
+    __syncthreads();
+
+    for (unsigned int stride = blockDim.x / 2; stride > 0; stride >>= 1) {
+        if (tid < stride) {
+            s_sum[tid] += s_sum[tid + stride];
+            s_sq[tid] += s_sq[tid + stride];
+        }
+        __syncthreads();
+    }
+
+    if (tid == 0) {
+        mean[blockIdx.x] = shift + s_sum[0] / n;
+        var[blockIdx.x] = (s_sq[0] - s_sum[0] * s_sum[0] / n) / (n - 1);
+        count[blockIdx.x] = n;
+    }
+}
+'''
+
+if cp is not None:
+    _segment_moments_kernel = cp.RawKernel(_SEGMENT_MOMENTS_SOURCE, 'segment_moments')
+    _welch_stats_kernel = cp.ElementwiseKernel(
+        'float64 mean_a, float64 var_a, int64 n_a, float64 mean_b, float64 var_b, int64 n_b',
+        'float64 diff, float64 se, float64 df, float64 effect',
+        '''
+        double se2_a = var_a / n_a;
+        double se2_b = var_b / n_b;
+        diff = mean_a - mean_b;
+        se = sqrt(se2_a + se2_b);
+        df = (se2_a + se2_b) * (se2_a + se2_b) / (se2_a * se2_a / (n_a - 1) + se2_b * se2_b / (n_b - 1));
+        effect = diff / sqrt(((n_a - 1) * var_a + (n_b - 1) * var_b) / (double)(n_a + n_b - 2));
+        ''',
+        'welch_stats'
+    )
+
+
+def _segment_moments_gpu(values, offsets):
+    """Per-segment mean, sample variance and size on the GPU"""
+    values = cp.ascontiguousarray(values, dtype=cp.float64)
+    offsets = cp.ascontiguousarray(offsets, dtype=cp.int64)
+    n_segments = offsets.size - 1
+    mean = cp.empty(n_segments, dtype=cp.float64)
+    var = cp.empty(n_segments, dtype=cp.float64)
+    count = cp.empty(n_segments, dtype=cp.int64)
+    if n_segments > 0:
+        _segment_moments_kernel((n_segments,), (_SEGMENT_MOMENTS_BLOCK,),
+                                (values, offsets, mean, var, count))
+    return mean, var, count
+
+
+def analyze_many_gpu(values_a, offsets_a, values_b, offsets_b,
+                     alpha: float, confidence_level: float) -> np.ndarray:
+    """Batched Welch's t-tests over CSR-packed groups (see _pack_groups) on the GPU"""
+    if len(offsets_a) != len(offsets_b):
+        raise ValueError('offsets_a and offsets_b must describe the same number of groups')
+    
+    if cp is None:
+        diff, se, df, effect = _welch_batch_cpu(
+            np.ascontiguousarray(values_a, dtype=np.float64), np.asarray(offsets_a, dtype=np.int64),
+            np.ascontiguousarray(values_b, dtype=np.float64), np.asarray(offsets_b, dtype=np.int64)
+        )
+        return _welch_batch_result(diff, se, df, effect, alpha, confidence_level)
+    
+    mean_a, var_a, n_a = _segment_moments_gpu(values_a, offsets_a)
+    mean_b, var_b, n_b = _segment_moments_gpu(values_b, offsets_b)
+    diff, se, df, effect = _welch_stats_kernel(mean_a, var_a, n_a, mean_b, var_b, n_b)
+    
+    # Only the per-test statistics come back to the host for the tail lookups
+    return _welch_batch_result(diff.get(), se.get(), df.get(), effect.get(), alpha, confidence_level)
+
+
+def _expand_conversions(conversions: int, total_users: int) -> np.ndarray:
+    """Per-user 0/1 outcomes as a compact int8 array (conversions first)"""
+    non_conversions = total_users - conversions
+    return np.concatenate([np.ones(conversions, dtype=np.int8), np.zeros(non_conversions, dtype=np.int8)])
+
+
 def convert_ab_test_data_to_analyzer_format(
     group_a_data: Dict[str, Any],
     group_b_data: Dict[str, Any]
-) -> Dict[str, List[float]]:
+) -> Dict[str, Union[List[float], np.ndarray]]:
     """Convert A/B test data to analyzer format"""
     # If continuous values are provided, use them directly
     if 'continuous_values' in group_a_data and 'continuous_values' in group_b_data:
@@ -294,33 +638,36 @@ def convert_ab_test_data_to_analyzer_format(
         }
     
     # Convert to binary arrays (0 = no conversion, 1 = conversion)
-    group_a = ([1] * group_a_data['conversions'] + 
-              [0] * (group_a_data['total_users'] - group_a_data['conversions']))
-    group_b = ([1] * group_b_data['conversions'] + 
-              [0] * (group_b_data['total_users'] - group_b_data['conversions']))
+    group_a = _expand_conversions(group_a_data['conversions'], group_a_data['total_users'])
+    group_b = _expand_conversions(group_b_data['conversions'], group_b_data['total_users'])
     
     return {'group_a': group_a, 'group_b': group_b}
 
 
 def calculate_continuous_metrics(data: List[float]) -> Dict[str, float]:
     """Calculate continuous metrics for a dataset"""
-    if not data:
+    values = np.asarray(data, dtype=np.float64)
+    if values.size == 0:
         return {'mean': 0, 'standard_deviation': 0, 'min': 0, 'max': 0, 'median': 0, 'count': 0}
     
-    sorted_data = sorted(data)
-    mean_val = np.mean(data)
-    std_dev = np.std(data, ddof=1)
-    
     return {
-        'mean': mean_val,
-        'standard_deviation': std_dev,
-        'min': sorted_data[0],
-        'max': sorted_data[-1],
-        'median': np.median(data),
-        'count': len(data)
+        'mean': values.mean(),
+        'standard_deviation': values.std(ddof=1),
+        'min': values.min(),
+        'max': values.max(),
+        'median': np.median(values),  # partition-based, no full sort
+        'count': values.size
     }
 
 
+_RESULT_FIELDS = tuple(field.name for field in fields(StatisticalResult))
+
+
+def _result_dict(result: StatisticalResult) -> Dict[str, Any]:
+    """Shallow dict of a result's fields (slotted dataclasses have no __dict__)"""
+    return {name: getattr(result, name) for name in _RESULT_FIELDS}
+
+
 def analyze_dynamic_ab_test(inputs: StatisticalInputs) -> Dict[str, Any]:
     """Enhanced analysis function that handles both conversion rates and continuous values"""
     base_result = analyze_data(inputs)
@@ -333,11 +680,11 @@ def analyze_dynamic_ab_test(inputs: StatisticalInputs) -> Dict[str, Any]:
         }
         
         return {
-            **base_result.__dict__,
+            **_result_dict(base_result),
             'continuous_metrics': continuous_metrics
         }
     
-    return base_result.__dict__
+    return _result_dict(base_result)
 
 
 def perform_dynamic_check(
@@ -355,6 +702,15 @@ def perform_dynamic_check(
     has_continuous_values = ('continuous_values' in control and 
                            'continuous_values' in variant)
     
+    # Conversion counts are sufficient statistics for the z-test, so the
+    # binary case never needs to expand them into per-user observations
+    if not has_continuous_values:
+        summary_a = BinarySummary(n=control['visitors'], x=control['conversions'])
+        summary_b = BinarySummary(n=variant['visitors'], x=variant['conversions'])
+        return _result_dict(two_proportion_z_test_summary(
+            summary_a, summary_b, params['significance_level'], params['confidence_level']
+        ))
+    
     data = convert_ab_test_data_to_analyzer_format(
         {
             'conversions': control['conversions'],
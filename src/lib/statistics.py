@@ -4,9 +4,19 @@
 # """
 
 import numpy as np
+import pandas as pd
 import scipy.stats as stats
+from functools import lru_cache
 from typing import List, Dict, Any, Optional, Tuple, Union
 
+from _proportion_tests import prop_ztest_core, z_cl
+
+
+@lru_cache(maxsize=64)
+def _z_alpha(alpha: float, two_tailed: bool) -> float:
+    """Critical z value for a significance level (cached)"""
+    return float(stats.norm.isf(alpha / 2 if two_tailed else alpha))
+
 
 def calculate_sample_size(
     p1: float,  # Control conversion rate
@@ -17,12 +27,8 @@ def calculate_sample_size(
 ) -> int:
     """Calculate sample size for two-proportion z-test"""
     # Calculate critical values based on actual alpha and beta values
-    if tail_type == 'two-tailed':
-        z_alpha = stats.norm.ppf(1 - alpha/2)
-    else:
-        z_alpha = stats.norm.ppf(1 - alpha)
-    
-    z_beta = stats.norm.ppf(1 - beta)
+    z_alpha = _z_alpha(alpha, tail_type == 'two-tailed')
+    z_beta = _z_alpha(beta, False)
     
     pooled_p = (p1 + p2) / 2
     effect = abs(p2 - p1)
@@ -44,34 +50,24 @@ def two_proportion_z_test(
     n1: int,  # Control sample size
     x2: int,  # Variant conversions
     n2: int,  # Variant sample size
-    tail_type: str = 'two-tailed'
+    tail_type: str = 'two-tailed',
+    confidence_level: float = 0.95
 ) -> Dict[str, Any]:
     """Perform two-proportion z-test"""
-    p1 = x1 / n1
-    p2 = x2 / n2
-    p_pool = (x1 + x2) / (n1 + n2)
+    z_score, p_value, ci_lower, ci_upper = prop_ztest_core(x1, n1, x2, n2, round(confidence_level, 6))
     
-    # Calculate z-score
-    standard_error = np.sqrt(p_pool * (1 - p_pool) * (1/n1 + 1/n2))
-    z_score = (p2 - p1) / standard_error
-    
-    # Calculate p-value
-    if tail_type == 'two-tailed':
-        p_value = 2 * (1 - stats.norm.cdf(abs(z_score)))
-    else:
-        p_value = 1 - stats.norm.cdf(z_score)
-    
-    # Calculate confidence interval for difference
-    se_diff = np.sqrt((p1 * (1 - p1) / n1) + (p2 * (1 - p2) / n2))
-    margin_of_error = 1.96 * se_diff  # 95% confidence
-    diff = p2 - p1
+    # One-tailed p-value tests p2 > p1
+    if tail_type != 'two-tailed':
+        p_value = float(stats.norm.sf(z_score))
     
     confidence_interval = {
-        'lower': diff - margin_of_error,
-        'upper': diff + margin_of_error
+        'lower': ci_lower,
+        'upper': ci_upper
     }
     
     # Calculate uplift
+    p1 = x1 / n1
+    p2 = x2 / n2
     uplift = ((p2 - p1) / p1) * 100 if p1 != 0 else 0
     
     return {
@@ -90,7 +86,7 @@ def calculate_confidence_interval(
 ) -> Dict[str, float]:
     """Calculate confidence interval for a proportion"""
     p = conversions / sample_size
-    z = 1.96 if confidence_level == 0.95 else 1.645
+    z = z_cl(confidence_level)
     standard_error = np.sqrt((p * (1 - p)) / sample_size)
     margin_of_error = z * standard_error
     
@@ -111,29 +107,28 @@ def analyze_test_data(
     try:
         variant_column_name = columns[variant_column]
         conversion_column_name = columns[conversion_column]
+        confidence_level = statistical_params.get('confidence_level', 0.95) if statistical_params else 0.95
         
-        # Check if we have continuous data
-        conversion_values = [row[conversion_column] for row in data[1:] 
-                           if row[conversion_column] is not None]
-        is_continuous = any(
-            isinstance(val, (int, float)) and val != 0 and val != 1 
-            for val in conversion_values
+        # Extract the two columns once; both branches work on these Series
+        rows = data[1:]
+        variant_values = pd.Series([row[variant_column] for row in rows], dtype=object)
+        conversion_raw = pd.Series([row[conversion_column] for row in rows], dtype=object)
+        
+        # Check if we have continuous data (non-numeric cells coerce to NaN)
+        conversion_values = pd.to_numeric(conversion_raw, errors='coerce')
+        is_continuous = bool(
+            ((conversion_values != 0) & (conversion_values != 1) & conversion_values.notna()).any()
         )
         
         if is_continuous:
             # Handle continuous data
-            variant_groups = {}
-            
-            for row in data[1:]:
-                variant = row[variant_column]
-                try:
-                    value = float(row[conversion_column])
-                    if not np.isnan(value):
-                        if variant not in variant_groups:
-                            variant_groups[variant] = []
-                        variant_groups[variant].append(value)
-                except (ValueError, TypeError):
-                    continue
+            observed = conversion_values.notna()
+            variant_groups = {
+                variant: values.to_numpy(dtype=np.float64)
+                for variant, values in conversion_values[observed].groupby(
+                    variant_values[observed], sort=False, dropna=False
+                )
+            }
             
             variant_names = list(variant_groups.keys())
             if len(variant_names) < 2:
@@ -144,11 +139,11 @@ def analyze_test_data(
             for name in variant_names:
                 variants.append({
                     'name': name,
-                    'visitors': len(variant_groups[name]),
+                    'visitors': variant_groups[name].size,
                     'conversions': 0,  # Not applicable for continuous data
                     'conversion_rate': 0,  # Not applicable for continuous data
                     'confidence_interval': {'lower': 0, 'upper': 0},
-                    'continuous_values': variant_groups[name]
+                    'continuous_values': variant_groups[name].tolist()
                 })
             
             # Perform t-test for continuous data
@@ -156,24 +151,22 @@ def analyze_test_data(
                 group_a = variant_groups[variant_names[0]]
                 group_b = variant_groups[variant_names[1]]
                 
-                t_stat, p_value = stats.ttest_ind(group_a, group_b, equal_var=False)
+                result = stats.ttest_ind(group_a, group_b, equal_var=False)
+                p_value = result.pvalue
                 
-                mean_diff = np.mean(group_a) - np.mean(group_b)
-                pooled_std = np.sqrt((np.var(group_a, ddof=1) + np.var(group_b, ddof=1)) / 2)
+                mean_diff = group_a.mean() - group_b.mean()
+                pooled_std = np.sqrt((group_a.var(ddof=1) + group_b.var(ddof=1)) / 2)
                 cohens_d = mean_diff / pooled_std if pooled_std != 0 else 0
                 
-                # Confidence interval for difference
-                se = np.sqrt(np.var(group_a, ddof=1)/len(group_a) + np.var(group_b, ddof=1)/len(group_b))
-                df = min(len(group_a), len(group_b)) - 1
-                t_critical = stats.t.ppf(0.975, df)
-                margin_of_error = t_critical * se
+                # Confidence interval for difference (Welch-Satterthwaite df)
+                confidence_interval = result.confidence_interval(confidence_level=confidence_level)
                 
                 analysis = {
-                    'sample_size': sum(len(variant_groups[name]) for name in variant_names),
+                    'sample_size': sum(variant_groups[name].size for name in variant_names),
                     'p_value': p_value,
                     'confidence_interval': {
-                        'lower': mean_diff - margin_of_error,
-                        'upper': mean_diff + margin_of_error
+                        'lower': confidence_interval.low,
+                        'upper': confidence_interval.high
                     },
                     'uplift': 0,  # Calculate based on means for continuous data
                     'is_significant': p_value < (statistical_params.get('significance_level', 0.05) if statistical_params else 0.05)
@@ -185,22 +178,16 @@ def analyze_test_data(
         
         else:
             # Handle categorical/binary data
-            variant_groups = {}
-            
-            for row in data:
-                variant = row[variant_column]
-                if variant not in variant_groups:
-                    variant_groups[variant] = []
-                variant_groups[variant].append(row)
+            converted = conversion_raw.isin(['Yes', '1', 1, True]).astype(np.int8)
+            variant_counts = converted.groupby(variant_values, sort=False, dropna=False).agg(['size', 'sum'])
             
             variants = []
-            for name, rows in variant_groups.items():
-                visitors = len(rows)
-                conversions = sum(1 for row in rows 
-                                if row[conversion_column] in ['Yes', '1', 1, True])
+            for name, visitors, conversions in variant_counts.itertuples(name=None):
+                visitors = int(visitors)
+                conversions = int(conversions)
                 
                 conversion_rate = conversions / visitors if visitors > 0 else 0
-                confidence_interval = calculate_confidence_interval(conversions, visitors)
+                confidence_interval = calculate_confidence_interval(conversions, visitors, confidence_level)
                 
                 variants.append({
                     'name': name,
@@ -220,7 +207,8 @@ def analyze_test_data(
                     control['conversions'],
                     control['visitors'],
                     variant['conversions'],
-                    variant['visitors']
+                    variant['visitors'],
+                    confidence_level=confidence_level
                 )
             
             return {'variants': variants, 'analysis': analysis}